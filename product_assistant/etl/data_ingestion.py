@@ -1,26 +1,102 @@
 # Standard Library Imports
+import hashlib
 import os
-from typing import List
+import random
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property
+from typing import Dict, Iterator, List, Optional
 
 # Third-Party Imports
 import pandas as pd  # For handling CSV data and dataframes
 from dotenv import load_dotenv
 # LangChain's document object for storing content + metadata
 from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from langchain_astradb import AstraDBVectorStore
 
 # Local Application Imports
+from product_assistant.etl.embed_cache import EmbeddingCache
 from product_assistant.utils.model_loader import ModelLoader
 from product_assistant.utils.config_loader import load_config
 
 
+# Columns read from the product reviews CSV
+REQUIRED_COLUMNS = (
+    "product_id",
+    "product_title",
+    "rating",
+    "total_reviews",
+    "price",
+    "top_reviews",
+)
+
+# Known schema of the product reviews CSV, so read_csv can skip type inference.
+# total_reviews and price are kept as scraped text (e.g. "1,234", "₹49,999").
+CSV_DTYPES = {
+    "product_id": "string[pyarrow]",
+    "product_title": "string[pyarrow]",
+    "rating": "float64[pyarrow]",
+    "total_reviews": "string[pyarrow]",
+    "price": "string[pyarrow]",
+    "top_reviews": "string[pyarrow]",
+}
+
+
+class _PrecomputedEmbeddings(Embeddings):
+    """
+    Embeddings adapter that serves vectors computed ahead of time.
+
+    AstraDBVectorStore always embeds through its `embedding` object, so this
+    wrapper lets us embed documents in large batches up front and hand the
+    vectors back on insert. Texts not found in the lookup (e.g. search
+    queries) fall through to the wrapped model.
+
+    Entries are reference-counted per `add` call, so a text shared by two
+    in-flight chunks keeps its vector until both have been discarded.
+    """
+
+    def __init__(self, embeddings: Embeddings):
+        self.embeddings = embeddings
+        self._vectors: Dict[str, List[float]] = {}
+        self._refcounts: Dict[str, int] = {}
+
+    def add(self, texts: List[str], vectors: List[List[float]]) -> None:
+        """Register precomputed vectors for `texts`."""
+        self._vectors.update(zip(texts, vectors))
+        for text in set(texts):
+            self._refcounts[text] = self._refcounts.get(text, 0) + 1
+
+    def discard(self, texts: List[str]) -> None:
+        """Release vectors registered by a matching `add` once they are uploaded."""
+        for text in set(texts):
+            remaining = self._refcounts.get(text, 0) - 1
+            if remaining > 0:
+                self._refcounts[text] = remaining
+            else:
+                self._refcounts.pop(text, None)
+                self._vectors.pop(text, None)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors = [self._vectors.get(text) for text in texts]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            fresh = self.embeddings.embed_documents([texts[i] for i in missing])
+            for i, vector in zip(missing, fresh):
+                vectors[i] = vector
+        return vectors  # type: ignore[return-value]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embeddings.embed_query(text)
+
+
 class DataIngestion:
     """
     Handles data transformation and ingestion into AstraDB vector store.
 
     This class:
         - Loads environment variables and validates them.
-        - Reads product review data from a CSV file.
+        - Streams product review data from a CSV file in chunks.
         - Transforms the reviews into LangChain Document objects.
         - Stores the documents into AstraDB vector store.
         - Provides a sample query execution for verification.
@@ -29,14 +105,15 @@ class DataIngestion:
     def __init__(self):
         """
         Initialize the DataIngestion pipeline by loading environment variables,
-        model loader, CSV data, and configuration.
+        CSV location, and configuration.
+
+        The CSV itself is read lazily, in chunks, by `_iter_csv_chunks`, and
+        the embedding model and vector store are only created on first use.
         """
         print("Initializing DataIngestion pipeline...")
 
-        self.model_loader = ModelLoader()
         self._load_env_variables()
         self.csv_path = self._get_csv_path()
-        self.product_data = self._load_csv()
         self.config = load_config()
 
     def _load_env_variables(self):
@@ -82,106 +159,359 @@ class DataIngestion:
 
         return csv_path
 
-    def _load_csv(self) -> pd.DataFrame:
+    def _iter_csv_chunks(self, chunksize: Optional[int] = None) -> Iterator[pd.DataFrame]:
         """
-        Load product reviews from the CSV file into a DataFrame.
+        Yield product reviews from the CSV file as DataFrame chunks.
 
-        Returns:
-            pd.DataFrame: DataFrame containing product reviews.
+        Args:
+            chunksize (Optional[int]): Rows per chunk. Defaults to
+                `ingestion.csv_chunksize` from config (or 5000).
+
+        Yields:
+            pd.DataFrame: Next chunk of product reviews.
 
         Raises:
             ValueError: If the CSV file does not contain required columns.
         """
-        df = pd.read_csv(self.csv_path)
-
-        expected_columns = {
-            "product_id",
-            "product_title",
-            "rating",
-            "total_reviews",
-            "price",
-            "top_reviews",
-        }
+        if chunksize is None:
+            chunksize = self.config.get("ingestion", {}).get("csv_chunksize", 5000)
+
+        # Parse only the columns we use; read_csv itself rejects files missing
+        # any of them. The pyarrow engine cannot read in chunks, so use the C
+        # engine but keep pyarrow-backed dtypes.
+        try:
+            reader = pd.read_csv(
+                self.csv_path,
+                usecols=REQUIRED_COLUMNS,
+                dtype=CSV_DTYPES,
+                # Keep the scraper's "N/A" placeholders as literal strings;
+                # pd.NA is not JSON-serializable and would break vector IDs.
+                na_filter=False,
+                dtype_backend="pyarrow",
+                chunksize=chunksize,
+            )
+        except ValueError as e:
+            raise ValueError(
+                f"CSV must contain columns: {list(REQUIRED_COLUMNS)} ({e})"
+            ) from e
+
+        with reader:
+            yield from reader
+
+    def transform_chunk(self, df: pd.DataFrame) -> List[Document]:
+        """
+        Transform a chunk of product review data into LangChain Document objects.
 
-        if not expected_columns.issubset(set(df.columns)):
-            raise ValueError(f"CSV must contain columns: {expected_columns}")
+        Args:
+            df (pd.DataFrame): Chunk of product reviews from `_iter_csv_chunks`.
 
-        return df
+        Returns:
+            List[Document]: A list of Document objects with product metadata and reviews.
+        """
+        # Pull each column out once as a plain Python list and zip them; this
+        # skips pandas' per-row machinery and yields native scalars.
+        product_ids = df["product_id"].to_numpy().tolist()
+        product_titles = df["product_title"].to_numpy().tolist()
+        ratings = df["rating"].to_numpy().tolist()
+        total_reviews_list = df["total_reviews"].to_numpy().tolist()
+        prices = df["price"].to_numpy().tolist()
+        top_reviews_list = df["top_reviews"].to_numpy().tolist()
+
+        return [
+            Document(
+                page_content=top_reviews,
+                metadata={
+                    "product_id": product_id,
+                    "product_title": product_title,
+                    "rating": rating,
+                    "total_reviews": total_reviews,
+                    "price": price,
+                },
+            )
+            for (
+                product_id,
+                product_title,
+                rating,
+                total_reviews,
+                price,
+                top_reviews,
+            ) in zip(
+                product_ids,
+                product_titles,
+                ratings,
+                total_reviews_list,
+                prices,
+                top_reviews_list,
+            )
+        ]
 
     def transform_data(self) -> List[Document]:
         """
-        Transform product review data into a list of LangChain Document objects.
+        Transform the whole CSV into a list of LangChain Document objects.
 
         Returns:
             List[Document]: A list of Document objects with product metadata and reviews.
         """
-        product_list = []
-
-        for _, row in self.product_data.iterrows():
-            product_entry = {
-                "product_id": row["product_id"],
-                "product_title": row["product_title"],
-                "rating": row["rating"],
-                "total_reviews": row["total_reviews"],
-                "price": row["price"],
-                "top_reviews": row["top_reviews"],
-            }
-            product_list.append(product_entry)
-
-        documents = []
-        for entry in product_list:
-            metadata = {
-                "product_id": entry["product_id"],
-                "product_title": entry["product_title"],
-                "rating": entry["rating"],
-                "total_reviews": entry["total_reviews"],
-                "price": entry["price"],
-            }
-            doc = Document(page_content=entry["top_reviews"], metadata=metadata)
-            documents.append(doc)
+        documents = [
+            doc for chunk in self._iter_csv_chunks() for doc in self.transform_chunk(chunk)
+        ]
 
         print(f"Transformed {len(documents)} documents.")
         return documents
 
-    def store_in_vector_db(self, documents: List[Document]):
+    def store_in_vector_db(
+        self, documents: List[Document], batch_size: Optional[int] = None
+    ):
         """
-        Store transformed documents into AstraDB vector store.
+        Store transformed documents into AstraDB vector store in fixed-size batches.
+
+        Embeddings for all documents are computed (or read from the local
+        embedding cache) up front, see `_embed_texts`, so the inserts only
+        carry precomputed vectors.
+
+        Batches are uploaded concurrently by a bounded thread pool, sized by
+        `astra_db.max_concurrent_batches` in config (default 4).
 
         Args:
             documents (List[Document]): List of LangChain Document objects.
+            batch_size (Optional[int]): Number of documents per insert request.
+                Defaults to `astra_db.ingest_batch_size` from config (or 128).
 
         Returns:
             Tuple[AstraDBVectorStore, List[str]]:
                 - The AstraDBVectorStore instance.
-                - List of inserted document IDs.
+                - List of upserted document IDs (see `_document_id`). They are
+                  in upload order, i.e. sorted by review length, not in the
+                  order of `documents`.
         """
-        collection_name = self.config["astra_db"]["collection_name"]
-
-        vstore = AstraDBVectorStore(
-            embedding=self.model_loader.load_embeddings(),
-            collection_name=collection_name,
+        with self._create_upload_executor() as executor:
+            futures = self._submit_documents(executor, documents, batch_size)
+            inserted_ids = self._collect_batches(futures)
+        self._precomputed_embeddings.discard([doc.page_content for doc in documents])
+
+        print(f"Successfully upserted {len(inserted_ids)} documents into AstraDB.")
+
+        return self.vector_store, inserted_ids
+
+    @cached_property
+    def embeddings(self) -> Embeddings:
+        """Embedding model, loaded on first use."""
+        return ModelLoader().load_embeddings()
+
+    @cached_property
+    def _precomputed_embeddings(self) -> _PrecomputedEmbeddings:
+        """Adapter serving precomputed vectors to `vector_store`."""
+        return _PrecomputedEmbeddings(self.embeddings)
+
+    @cached_property
+    def vector_store(self) -> AstraDBVectorStore:
+        """AstraDB vector store, created on first use and reused across runs."""
+        return AstraDBVectorStore(
+            embedding=self._precomputed_embeddings,
+            collection_name=self.config["astra_db"]["collection_name"],
             api_endpoint=self.db_api_endpoint,
             token=self.db_application_token,
             namespace=self.db_keyspace,
         )
 
-        inserted_ids = vstore.add_documents(documents)
-        print(f"Successfully inserted {len(inserted_ids)} documents into AstraDB.")
+    def _create_upload_executor(self) -> ThreadPoolExecutor:
+        """Create the bounded thread pool used to upload insert batches."""
+        max_workers = self.config["astra_db"].get("max_concurrent_batches", 4)
+        return ThreadPoolExecutor(max_workers=max_workers)
+
+    def _submit_documents(
+        self,
+        executor: ThreadPoolExecutor,
+        documents: List[Document],
+        batch_size: Optional[int] = None,
+    ) -> List[Future]:
+        """
+        Embed documents and submit their insert batches to `executor`.
+
+        Documents are sorted by length first, so both the embedding sub-batches
+        and the insert batches carry similarly sized reviews.
+
+        Args:
+            executor (ThreadPoolExecutor): Pool that performs the uploads.
+            documents (List[Document]): Documents to upload.
+            batch_size (Optional[int]): Number of documents per insert request.
+                Defaults to `astra_db.ingest_batch_size` from config (or 128).
+
+        Returns:
+            List[Future]: One future per batch, in length-sorted document order.
+        """
+        if batch_size is None:
+            batch_size = self.config["astra_db"].get("ingest_batch_size", 128)
+
+        documents = sorted(documents, key=lambda doc: len(doc.page_content))
+
+        texts = [doc.page_content for doc in documents]
+        self._precomputed_embeddings.add(texts, self._embed_texts(self.embeddings, texts))
+
+        ids = [self._document_id(doc) for doc in documents]
+        return [
+            executor.submit(
+                self._insert_batch,
+                self.vector_store,
+                documents[start : start + batch_size],
+                ids[start : start + batch_size],
+            )
+            for start in range(0, len(documents), batch_size)
+        ]
+
+    @staticmethod
+    def _collect_batches(futures: List[Future]) -> List[str]:
+        """
+        Wait for submitted insert batches and gather their IDs.
+
+        Results are collected in submission order rather than as they complete,
+        so the returned IDs follow the order the batches were submitted in.
+
+        Args:
+            futures (List[Future]): Futures returned by `_submit_documents`.
+
+        Returns:
+            List[str]: IDs of the inserted or replaced documents.
+        """
+        inserted_ids = []
+        for batch_num, future in enumerate(futures, 1):
+            inserted_ids.extend(future.result())
+            if batch_num % 10 == 0 or batch_num == len(futures):
+                print(f"Upserted batch {batch_num}/{len(futures)}.")
+        return inserted_ids
+
+    def _embed_texts(self, embeddings: Embeddings, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts in bulk, reusing cached vectors where possible.
+
+        Vectors are looked up in the local `EmbeddingCache` by content hash,
+        so unchanged reviews are never re-embedded across runs. Only cache
+        misses are sent to the model: they are sorted by length and split into
+        sub-batches of `embedding_model.batch_size` (default 100) so each
+        embedding request carries roughly uniform inputs.
+
+        Args:
+            embeddings (Embeddings): Embedding model to use.
+            texts (List[str]): Texts to embed.
+
+        Returns:
+            List[List[float]]: One vector per input text, in input order.
+        """
+        model_config = self.config["embedding_model"]
+        batch_size = model_config.get("batch_size", 100)
+        cache = EmbeddingCache(model_config["model_name"])
+
+        try:
+            keys = [EmbeddingCache.hash_text(text) for text in texts]
+            vectors_by_key = cache.get_many(keys)
+
+            # One text per uncached key, so duplicates are embedded only once.
+            missing = {}
+            for key, text in zip(keys, texts):
+                if key not in vectors_by_key:
+                    missing.setdefault(key, text)
+            missing_keys = sorted(missing, key=lambda k: len(missing[k]))
+
+            for start in range(0, len(missing_keys), batch_size):
+                batch_keys = missing_keys[start : start + batch_size]
+                batch_vectors = embeddings.embed_documents(
+                    [missing[key] for key in batch_keys]
+                )
+                new_vectors = dict(zip(batch_keys, batch_vectors))
+                cache.put_many(new_vectors.items())
+                vectors_by_key.update(new_vectors)
+        finally:
+            cache.close()
+
+        print(
+            f"Embedded {len(missing_keys)} documents "
+            f"({len(texts) - len(missing_keys)} served from cache)."
+        )
+        return [vectors_by_key[key] for key in keys]
+
+    @staticmethod
+    def _document_id(document: Document) -> str:
+        """
+        Build a deterministic vector ID for a document.
+
+        The ID combines the product ID with a short hash of the review text, so
+        re-ingesting unchanged rows upserts the existing vectors instead of
+        inserting duplicates.
+
+        Rows the scraper could not identify carry the placeholder product ID
+        "N/A" and often share a placeholder review ("No reviews found"), so
+        their hash also covers the product title. Otherwise they would all get
+        the same ID and overwrite each other in AstraDB.
+
+        Args:
+            document (Document): Document produced by `transform_data`.
+
+        Returns:
+            str: ID of the form `<product_id>:<sha1(page_content)[:12]>`, or
+                `<product_id>:<sha1(product_title + page_content)[:12]>` for
+                rows without a product ID.
+        """
+        product_id = document.metadata["product_id"]
+        content = document.page_content
+        if not product_id or product_id == "N/A":
+            # Unit separator keeps ("ab", "c") and ("a", "bc") apart
+            content = f"{document.metadata['product_title']}\x1f{content}"
+
+        content_hash = hashlib.sha1(content.encode("utf-8")).hexdigest()
+        return f"{product_id}:{content_hash[:12]}"
+
+    @staticmethod
+    def _insert_batch(
+        vstore: AstraDBVectorStore, batch: List[Document], ids: List[str]
+    ) -> List[str]:
+        """
+        Upsert a single batch of documents, after a small random delay so that
+        concurrent workers don't hit AstraDB's rate limits all at once.
+
+        Args:
+            vstore (AstraDBVectorStore): Target vector store.
+            batch (List[Document]): Documents to insert.
+            ids (List[str]): Deterministic IDs for `batch`, see `_document_id`.
 
-        return vstore, inserted_ids
+        Returns:
+            List[str]: IDs of the inserted or replaced documents.
+        """
+        time.sleep(random.uniform(0, 0.1))
+        return vstore.add_documents(batch, ids=ids)
 
     def run_pipeline(self):
         """
         Execute the full data ingestion pipeline:
-            1. Transform data into LangChain documents.
-            2. Store documents in AstraDB vector store.
+            1. Stream the CSV in chunks and transform each into LangChain documents.
+            2. Embed each chunk and upload it to AstraDB while the next chunk
+               is being read, keeping at most two chunks in flight.
             3. Perform a sample similarity search query.
         """
-        documents = self.transform_data()
-        vstore, _ = self.store_in_vector_db(documents)
+        precomputed = self._precomputed_embeddings
+        inserted_ids = []
+        pending = None
+
+        with self._create_upload_executor() as executor:
+            for chunk_num, chunk in enumerate(self._iter_csv_chunks(), 1):
+                documents = self.transform_chunk(chunk)
+                futures = self._submit_documents(executor, documents)
+                print(f"Submitted chunk {chunk_num} ({len(documents)} documents).")
+
+                # Drain the previous chunk only after this one is queued, so
+                # parsing and embedding overlap with the uploads.
+                if pending is not None:
+                    inserted_ids.extend(self._collect_batches(pending[1]))
+                    precomputed.discard([doc.page_content for doc in pending[0]])
+                pending = (documents, futures)
+
+            if pending is not None:
+                inserted_ids.extend(self._collect_batches(pending[1]))
+                precomputed.discard([doc.page_content for doc in pending[0]])
+
+        print(f"Successfully upserted {len(inserted_ids)} documents into AstraDB.")
 
         query = "Can you tell me the low budget iphone?"
-        results = vstore.similarity_search(query)
+        results = self.vector_store.similarity_search(query)
 
         print(f"\nSample search results for query: '{query}'")
         for res in results:
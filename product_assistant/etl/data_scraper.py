@@ -1,88 +1,208 @@
 # Standard Library Imports
 import csv
-import time
+import hashlib
 import re
 import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # Third-Party Imports
-from bs4 import BeautifulSoup
 import undetected_chromedriver as uc
+from lxml import etree
+from lxml import html as lxml_html
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
 # Local Application Imports
 # (none for now)
 
+
+def _has_class(name: str) -> str:
+    """Build an XPath predicate matching elements whose class list contains `name`."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Review blocks, equivalent to the CSS selector
+# "div._27M-vq, div.col.EPCmJX, div._6K-7Co". Compiled once at import time.
+_REVIEW_BLOCKS_XPATH = etree.XPath(
+    f"//div[{_has_class('_27M-vq')}"
+    f" or ({_has_class('col')} and {_has_class('EPCmJX')})"
+    f" or {_has_class('_6K-7Co')}]"
+)
+_REVIEW_BLOCKS_CSS = "div._27M-vq, div.col.EPCmJX, div._6K-7Co"
+
+# Review count in listing text, e.g. "1,234 Reviews"
+_REVIEWS_RE = re.compile(r"\d+(?:,\d+)?(?=\s+Reviews)")
+# Flipkart product ID in a product URL path, e.g. "/p/itm123abc"
+_PID_RE = re.compile(r"/p/(itm[0-9A-Za-z]+)")
+
+# Upper bound (in seconds) for waits on page content; waits return as soon
+# as the content shows up.
+_PAGE_LOAD_TIMEOUT = 10
+_SCROLL_TIMEOUT = 3
+
+_PAGE_HEIGHT_JS = "return document.body.scrollHeight"
+_SCROLL_TO_BOTTOM_JS = "window.scrollTo(0, document.body.scrollHeight)"
+
+
+def _wait_until(driver, condition, timeout: float) -> bool:
+    """Wait for `condition` on `driver`, returning False instead of raising on timeout."""
+    try:
+        WebDriverWait(driver, timeout).until(condition)
+        return True
+    except TimeoutException:
+        return False
+
+
 class FlipkartScraper:
     """A scraper class to extract product details and reviews from Flipkart."""
 
-    def __init__(self, output_dir="data"):
+    def __init__(self, output_dir="data", review_workers=4):
         """Initialize the FlipkartScraper.
 
         Args:
             output_dir (str, optional): Directory to store the output CSV files.
                 Defaults to "data".
+            review_workers (int, optional): Number of Chrome drivers used to
+                fetch product reviews in parallel. Defaults to 4.
+
+        Raises:
+            ValueError: If `review_workers` is less than 1.
         """
+        if review_workers < 1:
+            raise ValueError(f"review_workers must be at least 1, got {review_workers}")
+
         self.output_dir = output_dir
+        self.review_workers = review_workers
         os.makedirs(self.output_dir, exist_ok=True)
 
-    def get_top_reviews(self, product_url: str, count: int = 2) -> str:
+    def _create_review_driver(self) -> uc.Chrome:
+        """Create a Chrome driver configured for loading product review pages.
+
+        Returns:
+            uc.Chrome: A new undetected Chrome driver.
+        """
+        options = uc.ChromeOptions()
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        return uc.Chrome(options=options, use_subprocess=True)
+
+    def get_top_reviews(
+        self, product_url: str, count: int = 2, driver: uc.Chrome | None = None
+    ) -> str:
         """Retrieve top reviews for a given product URL from Flipkart.
 
         Args:
             product_url (str): The URL of the product page on Flipkart.
             count (int, optional): Maximum number of top reviews to fetch.
                 Defaults to 2.
+            driver (uc.Chrome, optional): An existing driver to load the page
+                with. It is left open for the caller to reuse. If omitted, a
+                temporary driver is created and closed. Defaults to None.
 
         Returns:
             str: Concatenated top reviews separated by `||` if found,
                 otherwise "No reviews found".
         """
-        options = uc.ChromeOptions()
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        driver = uc.Chrome(options=options, use_subprocess=True)
+        if not self._is_valid_url(product_url):
+            return "No reviews found"
+
+        owns_driver = driver is None
+        if owns_driver:
+            driver = self._create_review_driver()
 
-        if (
-            not product_url
-            or not isinstance(product_url, str)
-            or not product_url.startswith("http")
-        ):
+        try:
+            return self._read_top_reviews(
+                driver, product_url, count, clear_cookies=not owns_driver
+            )
+        except Exception as e:
+            print(f"Error occurred while fetching reviews for {product_url}: {e}")
             return "No reviews found"
+        finally:
+            if owns_driver:
+                driver.quit()
+
+    @staticmethod
+    def _is_valid_url(product_url) -> bool:
+        """Check that `product_url` is an absolute http(s) URL string."""
+        return (
+            bool(product_url)
+            and isinstance(product_url, str)
+            and product_url.startswith("http")
+        )
+
+    def _read_top_reviews(
+        self, driver: uc.Chrome, product_url: str, count: int, clear_cookies: bool
+    ) -> str:
+        """Load a product page with `driver` and extract its top reviews.
+
+        Unlike `get_top_reviews`, errors are not swallowed, so callers can tell
+        a dead driver (`WebDriverException`) apart from a page without reviews.
+
+        Args:
+            driver (uc.Chrome): Driver to load the page with.
+            product_url (str): The URL of the product page on Flipkart.
+            count (int): Maximum number of top reviews to fetch.
+            clear_cookies (bool): Whether to clear cookies first, for drivers
+                reused across products.
+
+        Returns:
+            str: Concatenated top reviews separated by `||` if found,
+                otherwise "No reviews found".
+        """
+        if clear_cookies:
+            # Don't let cookies/session state from the previous product bleed in
+            driver.delete_all_cookies()
 
+        # get() blocks until the document has loaded; lazily loaded reviews
+        # are waited for by the scroll loop below.
+        driver.get(product_url)
+
+        # Try closing login popup if it appears
         try:
-            driver.get(product_url)
-            time.sleep(4)
+            driver.find_element(By.XPATH, "//button[contains(text(), '✕')]").click()
+        except Exception as e:
+            print(f"Error occurred while closing popup: {e}")
+
+        # Scroll to load reviews until enough review blocks are present
+        # or the page stops growing
+        prev_height = driver.execute_script(_PAGE_HEIGHT_JS)
+        for _ in range(6):
+            if len(driver.find_elements(By.CSS_SELECTOR, _REVIEW_BLOCKS_CSS)) >= count:
+                break
+            driver.execute_script(_SCROLL_TO_BOTTOM_JS)
+            if not _wait_until(
+                driver,
+                lambda d: d.execute_script(_PAGE_HEIGHT_JS) > prev_height,
+                _SCROLL_TIMEOUT,
+            ):
+                break
+            prev_height = driver.execute_script(_PAGE_HEIGHT_JS)
+
+        tree = lxml_html.fromstring(driver.page_source)
+        # BeautifulSoup's get_text() never included script/style contents
+        etree.strip_elements(tree, "script", "style", with_tail=False)
+        review_blocks = _REVIEW_BLOCKS_XPATH(tree)
+        # Dedupe on fixed-size digests rather than full review texts
+        seen_hashes = set()
+        reviews = []
+
+        for block in review_blocks:
+            # Space-join stripped text nodes, like BeautifulSoup's
+            # get_text(separator=" ", strip=True)
+            text = " ".join(t.strip() for t in block.itertext() if t.strip())
+            if not text:
+                continue
+            text_hash = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+            if text_hash not in seen_hashes:
+                reviews.append(text)
+                seen_hashes.add(text_hash)
+            if len(reviews) >= count:
+                break
 
-            # Try closing login popup if it appears
-            try:
-                driver.find_element(By.XPATH, "//button[contains(text(), '✕')]").click()
-                time.sleep(1)
-            except Exception as e:
-                print(f"Error occurred while closing popup: {e}")
-
-            # Scroll to load reviews
-            for _ in range(4):
-                ActionChains(driver).send_keys(Keys.END).perform()
-                time.sleep(1.5)
-
-            soup = BeautifulSoup(driver.page_source, "html.parser")
-            review_blocks = soup.select("div._27M-vq, div.col.EPCmJX, div._6K-7Co")
-            seen = set()
-            reviews = []
-
-            for block in review_blocks:
-                text = block.get_text(separator=" ", strip=True)
-                if text and text not in seen:
-                    reviews.append(text)
-                    seen.add(text)
-                if len(reviews) >= count:
-                    break
-        except Exception:
-            reviews = []
-
-        driver.quit()
         return " || ".join(reviews) if reviews else "No reviews found"
 
     def scrape_flipkart_products(
@@ -105,7 +225,11 @@ class FlipkartScraper:
         driver = uc.Chrome(options=options, use_subprocess=True)
         search_url = f"https://www.flipkart.com/search?q={query.replace(' ', '+')}"
         driver.get(search_url)
-        time.sleep(4)
+        _wait_until(
+            driver,
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-id]")),
+            _PAGE_LOAD_TIMEOUT,
+        )
 
         # Close login popup if it appears
         try:
@@ -113,61 +237,139 @@ class FlipkartScraper:
         except Exception as e:
             print(f"Error occurred while closing popup: {e}")
 
-        time.sleep(2)
         products = []
+        product_links = []
 
         items = driver.find_elements(By.CSS_SELECTOR, "div[data-id]")[:max_products]
-        for item in items:
+        try:
+            for item in items:
+                try:
+                    title = item.find_element(By.CSS_SELECTOR, "div.KzDlHZ").text.strip()
+                    price = item.find_element(By.CSS_SELECTOR, "div.Nx9bqj").text.strip()
+                    rating = item.find_element(By.CSS_SELECTOR, "div.XQDdHH").text.strip()
+                    reviews_text = item.find_element(
+                        By.CSS_SELECTOR, "span.Wphh3N"
+                    ).text.strip()
+                    match = _REVIEWS_RE.search(reviews_text)
+                    total_reviews = match.group(0) if match else "N/A"
+
+                    link_el = item.find_element(By.CSS_SELECTOR, "a[href*='/p/']")
+                    href = link_el.get_attribute("href")
+                    # product_link = (
+                    #     href
+                    #     if href.startswith("http")
+                    #     else "https://www.flipkart.com" + href
+                    # )
+                    if href:
+                        product_link = (
+                            href
+                            if href.startswith("http")
+                            else "https://www.flipkart.com" + href
+                        )
+                    else:
+                        product_link = None
+
+                    # match = re.findall(r"/p/(itm[0-9A-Za-z]+)", href)
+                    match = _PID_RE.search(href) if href else None
+                    product_id = match.group(1) if match else "N/A"
+                except Exception as e:
+                    print(f"Error occurred while processing item: {e}")
+                    continue
+
+                products.append([product_id, title, rating, total_reviews, price])
+                product_links.append(product_link)
+        finally:
+            driver.quit()
+
+        top_reviews = self._fetch_reviews(product_links, review_count)
+        for product, reviews in zip(products, top_reviews):
+            product.append(reviews)
+
+        return products
+
+    def _fetch_reviews(self, product_links: list, count: int) -> list:
+        """Fetch top reviews for several products concurrently.
+
+        A fixed pool of review drivers is shared between worker threads, so
+        page loads for different products overlap instead of running one by one.
+        A driver that fails with `WebDriverException` is replaced by a fresh one
+        and the product is retried once.
+
+        Args:
+            product_links (list): Product page URLs (entries may be None).
+            count (int): Number of top reviews to fetch per product.
+
+        Returns:
+            list: Top reviews per product, in the same order as `product_links`.
+                Invalid links map to "Invalid product URL".
+        """
+        results = ["Invalid product URL"] * len(product_links)
+        valid = [
+            i
+            for i, link in enumerate(product_links)
+            if link and "flipkart.com" in link
+        ]
+        if not valid:
+            return results
+
+        drivers = []
+        drivers_lock = threading.Lock()
+        driver_pool = queue.Queue()
+
+        def replace_driver(driver: uc.Chrome) -> uc.Chrome:
+            # Start the new driver before retiring the old one so `drivers`
+            # always holds every process the finally below must quit. The lock
+            # also keeps Chrome launches serialized (see below).
+            with drivers_lock:
+                new_driver = self._create_review_driver()
+                drivers.append(new_driver)
+                drivers.remove(driver)
             try:
-                title = item.find_element(By.CSS_SELECTOR, "div.KzDlHZ").text.strip()
-                price = item.find_element(By.CSS_SELECTOR, "div.Nx9bqj").text.strip()
-                rating = item.find_element(By.CSS_SELECTOR, "div.XQDdHH").text.strip()
-                reviews_text = item.find_element(
-                    By.CSS_SELECTOR, "span.Wphh3N"
-                ).text.strip()
-                match = re.search(r"\d+(,\d+)?(?=\s+Reviews)", reviews_text)
-                total_reviews = match.group(0) if match else "N/A"
-
-                link_el = item.find_element(By.CSS_SELECTOR, "a[href*='/p/']")
-                href = link_el.get_attribute("href")
-                # product_link = (
-                #     href
-                #     if href.startswith("http")
-                #     else "https://www.flipkart.com" + href
-                # )
-                if href:
-                    product_link = (
-                        href
-                        if href.startswith("http")
-                        else "https://www.flipkart.com" + href
-                    )
-                else:
-                    product_link = None
-
-                # match = re.findall(r"/p/(itm[0-9A-Za-z]+)", href)
-                match = re.findall(r"/p/(itm[0-9A-Za-z]+)", href) if href else []
-                product_id = match[0] if match else "N/A"
+                driver.quit()
+            except Exception:
+                pass  # The old Chrome process is usually already gone
+            return new_driver
+
+        def fetch(link: str) -> str:
+            driver = driver_pool.get()
+            try:
+                try:
+                    return self._read_top_reviews(driver, link, count, clear_cookies=True)
+                except WebDriverException as e:
+                    # A pooled driver whose Chrome died would fail every later
+                    # product it is handed, so restart it and retry once.
+                    print(f"Review driver failed on {link}, restarting it: {e}")
+                    driver = replace_driver(driver)
+                    return self._read_top_reviews(driver, link, count, clear_cookies=False)
             except Exception as e:
-                print(f"Error occurred while processing item: {e}")
-                continue
+                print(f"Error occurred while fetching reviews for {link}: {e}")
+                return "No reviews found"
+            finally:
+                driver_pool.put(driver)
 
-            # top_reviews = (
-            #     self.get_top_reviews(product_link, count=review_count)
-            #     if "flipkart.com" in product_link
-            #     else "Invalid product URL"
-            # )
-            top_reviews = (
-                self.get_top_reviews(product_link, count=review_count)
-                if product_link and "flipkart.com" in product_link
-                else "Invalid product URL"
-            )
+        try:
+            # Drivers are started one at a time; undetected_chromedriver patches
+            # the chromedriver binary on startup and isn't safe to launch in
+            # parallel. Each is tracked right away so the finally below quits it
+            # even if a later one fails to start.
+            for _ in range(min(self.review_workers, len(valid))):
+                driver = self._create_review_driver()
+                with drivers_lock:
+                    drivers.append(driver)
+                driver_pool.put(driver)
 
-            products.append(
-                [product_id, title, rating, total_reviews, price, top_reviews]
-            )
+            with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+                futures = {executor.submit(fetch, product_links[i]): i for i in valid}
+                for future, i in futures.items():
+                    results[i] = future.result()
+        finally:
+            for driver in drivers:
+                try:
+                    driver.quit()
+                except Exception as e:
+                    print(f"Error occurred while closing review driver: {e}")
 
-        driver.quit()
-        return products
+        return results
 
     def save_to_csv(self, data: list, filename: str = "product_reviews.csv") -> None:
         """Save scraped product data into a CSV file.
@@ -191,7 +393,8 @@ class FlipkartScraper:
             # plain filename like 'output.csv'
             path = os.path.join(self.output_dir, filename)
 
-        with open(path, "w", newline="", encoding="utf-8") as f:
+        # A 1 MiB buffer lets large scrapes flush in a few big writes.
+        with open(path, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
             writer = csv.writer(f)
             writer.writerow(
                 [
@@ -0,0 +1,126 @@
+# Standard Library Imports
+import hashlib
+import os
+import sqlite3
+from array import array
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Maximum number of keys per `get_many` query
+_LOOKUP_CHUNK_SIZE = 500
+
+
+class EmbeddingCache:
+    """
+    Persistent SQLite cache of embedding vectors keyed by content hash.
+
+    Vectors are stored per embedding model, so switching models never serves
+    stale vectors. Keys are the SHA-256 digest of the embedded text.
+    """
+
+    def __init__(self, model_name: str, cache_path: Optional[str] = None):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            model_name (str): Name of the embedding model the vectors belong to.
+            cache_path (Optional[str]): Path to the SQLite file.
+                Defaults to `.embed_cache.sqlite` in the current working directory.
+        """
+        self.model_name = model_name
+        self.cache_path = cache_path or os.path.join(os.getcwd(), ".embed_cache.sqlite")
+
+        self._conn = sqlite3.connect(self.cache_path)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                model TEXT NOT NULL,
+                hash BLOB NOT NULL,
+                vector BLOB NOT NULL,
+                PRIMARY KEY (model, hash)
+            )
+            """
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def hash_text(text: str) -> bytes:
+        """Return the SHA-256 digest used as the cache key for `text`."""
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
+    def get(self, key: bytes) -> Optional[List[float]]:
+        """
+        Look up a cached vector.
+
+        Args:
+            key (bytes): Content hash from `hash_text`.
+
+        Returns:
+            Optional[List[float]]: The cached vector, or None on a miss.
+        """
+        row = self._conn.execute(
+            "SELECT vector FROM embeddings WHERE model = ? AND hash = ?",
+            (self.model_name, key),
+        ).fetchone()
+        return self._decode(row[0]) if row else None
+
+    def get_many(self, keys: Iterable[bytes]) -> Dict[bytes, List[float]]:
+        """
+        Look up several cached vectors at once.
+
+        Args:
+            keys (Iterable[bytes]): Content hashes from `hash_text`.
+
+        Returns:
+            Dict[bytes, List[float]]: Vectors for the keys that were found.
+        """
+        found = {}
+        unique_keys = list(set(keys))
+        # Stay well below SQLite's bound-parameter limit per query.
+        for start in range(0, len(unique_keys), _LOOKUP_CHUNK_SIZE):
+            chunk = unique_keys[start : start + _LOOKUP_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT hash, vector FROM embeddings "
+                f"WHERE model = ? AND hash IN ({placeholders})",
+                (self.model_name, *chunk),
+            )
+            for key, blob in rows:
+                found[key] = self._decode(blob)
+        return found
+
+    def put(self, key: bytes, vector: List[float]) -> None:
+        """
+        Store a single vector.
+
+        Args:
+            key (bytes): Content hash from `hash_text`.
+            vector (List[float]): Embedding vector.
+        """
+        self.put_many([(key, vector)])
+
+    def put_many(self, items: Iterable[Tuple[bytes, List[float]]]) -> None:
+        """
+        Store several vectors in a single transaction.
+
+        Args:
+            items (Iterable[Tuple[bytes, List[float]]]): (content hash, vector) pairs.
+        """
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings (model, hash, vector) VALUES (?, ?, ?)",
+                ((self.model_name, key, self._encode(vector)) for key, vector in items),
+            )
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+    @staticmethod
+    def _encode(vector: List[float]) -> bytes:
+        return array("d", vector).tobytes()
+
+    @staticmethod
+    def _decode(blob: bytes) -> List[float]:
+        vector = array("d")
+        vector.frombytes(blob)
+        return vector.tolist()
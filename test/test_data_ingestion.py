@@ -0,0 +1,129 @@
+import csv
+import pathlib
+import tempfile
+import unittest
+
+from langchain_core.documents import Document
+
+from product_assistant.etl.data_ingestion import (
+    REQUIRED_COLUMNS,
+    DataIngestion,
+    _PrecomputedEmbeddings,
+)
+
+
+def _document(product_id, product_title, page_content="No reviews found"):
+    return Document(
+        page_content=page_content,
+        metadata={
+            "product_id": product_id,
+            "product_title": product_title,
+            "rating": 4.5,
+            "total_reviews": "N/A",
+            "price": "₹9,999",
+        },
+    )
+
+
+class TestDocumentId(unittest.TestCase):
+    def test_id_is_deterministic(self):
+        doc = _document("itm123", "Phone A", "Great phone")
+        self.assertEqual(DataIngestion._document_id(doc), DataIngestion._document_id(doc))
+        self.assertTrue(DataIngestion._document_id(doc).startswith("itm123:"))
+
+    def test_same_review_different_product_ids(self):
+        self.assertNotEqual(
+            DataIngestion._document_id(_document("itm1", "Phone A")),
+            DataIngestion._document_id(_document("itm2", "Phone B")),
+        )
+
+    def test_rows_without_product_id_do_not_collide(self):
+        first = _document("N/A", "Phone A")
+        second = _document("N/A", "Phone B")
+
+        self.assertNotEqual(
+            DataIngestion._document_id(first), DataIngestion._document_id(second)
+        )
+
+
+class _FakeEmbeddings:
+    """Stand-in embedding model that records which texts it was asked to embed."""
+
+    def __init__(self):
+        self.calls = []
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [[-1.0] for _ in texts]
+
+
+class TestPrecomputedEmbeddings(unittest.TestCase):
+    def test_shared_text_survives_until_last_discard(self):
+        model = _FakeEmbeddings()
+        precomputed = _PrecomputedEmbeddings(model)
+        shared = "No reviews found"
+
+        precomputed.add([shared, "chunk one"], [[1.0], [2.0]])
+        precomputed.add([shared, "chunk two"], [[1.0], [3.0]])
+
+        precomputed.discard([shared, "chunk one"])
+        self.assertEqual(precomputed.embed_documents([shared]), [[1.0]])
+        self.assertEqual(model.calls, [])
+
+        precomputed.discard([shared, "chunk two"])
+        self.assertEqual(precomputed.embed_documents([shared]), [[-1.0]])
+        self.assertEqual(model.calls, [[shared]])
+
+
+class TestCsvTransform(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        csv_path = pathlib.Path(self.tmp_dir.name) / "product_reviews.csv"
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow([*REQUIRED_COLUMNS, "unused"])
+            writer.writerow(["N/A", "Phone A", "4.1", "N/A", "₹9,999", "No reviews found", "x"])
+            writer.writerow(["itm2", "Phone B", "3", "1,234", "₹499", "Great phone", "y"])
+
+        # Bypass __init__, which needs environment variables and data/ in CWD
+        self.ingestion = DataIngestion.__new__(DataIngestion)
+        self.ingestion.csv_path = str(csv_path)
+        self.ingestion.config = {}
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _documents(self):
+        return [
+            doc
+            for chunk in self.ingestion._iter_csv_chunks(chunksize=1)
+            for doc in self.ingestion.transform_chunk(chunk)
+        ]
+
+    def test_placeholders_stay_literal_strings(self):
+        first = self._documents()[0]
+
+        self.assertEqual(first.metadata["product_id"], "N/A")
+        self.assertEqual(first.metadata["total_reviews"], "N/A")
+        self.assertEqual(first.page_content, "No reviews found")
+
+    def test_metadata_uses_native_python_types(self):
+        documents = self._documents()
+
+        self.assertEqual(len(documents), 2)
+        for doc in documents:
+            self.assertIs(type(doc.metadata["rating"]), float)
+            self.assertIs(type(doc.metadata["price"]), str)
+            self.assertIs(type(doc.page_content), str)
+        self.assertEqual(documents[0].metadata["rating"], 4.1)
+
+    def test_missing_column_raises_value_error(self):
+        with open(self.ingestion.csv_path, "w", encoding="utf-8") as f:
+            f.write("product_id,product_title\nitm1,Phone A\n")
+
+        with self.assertRaises(ValueError):
+            list(self.ingestion._iter_csv_chunks())
+
+
+if __name__ == "__main__":
+    unittest.main()
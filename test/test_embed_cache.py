@@ -0,0 +1,61 @@
+import pathlib
+import tempfile
+import unittest
+
+from product_assistant.etl.embed_cache import EmbeddingCache
+
+
+class TestEmbeddingCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.cache_path = str(pathlib.Path(self.tmp_dir.name) / "cache.sqlite")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_encode_decode_round_trip(self):
+        vector = [0.1, -2.5, 3.0, 1e-12]
+        self.assertEqual(EmbeddingCache._decode(EmbeddingCache._encode(vector)), vector)
+
+    def test_put_many_get_many_round_trip(self):
+        cache = EmbeddingCache("model-a", self.cache_path)
+        items = {
+            EmbeddingCache.hash_text(f"review {i}"): [float(i), 0.5] for i in range(1200)
+        }
+        cache.put_many(items.items())
+
+        missing = EmbeddingCache.hash_text("never stored")
+        found = cache.get_many([*items, missing])
+        cache.close()
+
+        self.assertEqual(found, items)
+        self.assertNotIn(missing, found)
+
+    def test_vectors_persist_across_instances(self):
+        key = EmbeddingCache.hash_text("great phone")
+        cache = EmbeddingCache("model-a", self.cache_path)
+        cache.put(key, [1.0, 2.0])
+        cache.close()
+
+        cache = EmbeddingCache("model-a", self.cache_path)
+        self.assertEqual(cache.get(key), [1.0, 2.0])
+        cache.close()
+
+    def test_vectors_are_scoped_by_model(self):
+        key = EmbeddingCache.hash_text("great phone")
+        cache_a = EmbeddingCache("model-a", self.cache_path)
+        cache_b = EmbeddingCache("model-b", self.cache_path)
+        cache_a.put(key, [1.0, 2.0])
+
+        self.assertIsNone(cache_b.get(key))
+        self.assertEqual(cache_b.get_many([key]), {})
+
+        cache_b.put(key, [3.0])
+        self.assertEqual(cache_a.get(key), [1.0, 2.0])
+        self.assertEqual(cache_b.get_many([key]), {key: [3.0]})
+        cache_a.close()
+        cache_b.close()
+
+
+if __name__ == "__main__":
+    unittest.main()